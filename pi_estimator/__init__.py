@@ -0,0 +1,3 @@
+from .pi_estimator import PiEstimator
+
+__all__ = ["PiEstimator"]
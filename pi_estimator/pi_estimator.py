@@ -1,16 +1,159 @@
+import os
+import multiprocessing
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.gridspec as gridspec
-import seaborn as sns
-from scipy.special import erfinv
-from scipy.stats import norm
-from math import factorial
+from matplotlib.colors import to_rgba_array
+from matplotlib.patches import Polygon
+from scipy.special import erfinv, gammaln
+from scipy.stats import qmc
+from math import floor, log10
+from concurrent.futures import ProcessPoolExecutor
+from numba import njit, prange
 from prettytable import PrettyTable
 
 
 __all__ = ["PiEstimator"]
 
+
+_ERFINV_095 = float(erfinv(0.95))
+_N_STREAMS = 64
+_TILE_SIZE = 2**16
+_PARALLEL_MIN_SAMPLES = 5*10**7
+
+# Numba records the module name in its cache, which can then only be loaded under
+# that same name. The kernel is therefore only cached when imported from the package.
+_CACHE_KERNELS = __name__ == "pi_estimator.pi_estimator"
+
+
+@njit(parallel=True, fastmath=True, cache=_CACHE_KERNELS)
+def _mc_kernel(n_samples, n_dim, streams, store_samples):
+    """
+    Draws pseudo-random points in [-1, 1]^n_dim and counts those inside the unit n-sphere.
+
+    The random draw, the squared norm, the label and the running count are fused in
+    a single pass over memory. The samples are split into one contiguous block per 
+    random stream and the blocks are processed in parallel, so that the draw is 
+    reproducible regardless of the number of threads.
+
+    Keyword arguments:
+        n_samples (int):
+            The number of samples to draw.
+
+        n_dim (int):
+            The number of dimensions of the space.
+
+        streams (tuple of np.random.Generator):
+            The independent random number generators, one per block of samples.
+
+        store_samples (bool):
+            If False, the coordinates and labels are not stored and empty arrays 
+            are returned in their place.
+
+    Returns:
+        coords (np.ndarray): float32 array of shape (n_samples, n_dim)
+            The coordinates of the sample points.
+
+        inside (np.ndarray): bool array of shape (n_samples,)
+            True where the point is inside the n-sphere.
+
+        count (np.ndarray): array of shape (n_samples,)
+            The cumulative number of points inside the n-sphere at each draw.
+    """
+
+    n_stored = n_samples if store_samples else 0
+    coords = np.empty((n_stored, n_dim), dtype=np.float32)
+    inside = np.empty(n_stored, dtype=np.bool_)
+    count = np.empty(n_samples, dtype=np.int64)
+    n_blocks = len(streams)
+    block_size = (n_samples + n_blocks - 1)//n_blocks
+    block_count = np.zeros(n_blocks, dtype=np.int64)
+
+    for c in prange(n_blocks):
+        rng = streams[c]
+        running = 0
+        for i in range(c*block_size, min((c + 1)*block_size, n_samples)):
+            # the default 2-dimensional case is unrolled
+            if n_dim == 2:
+                x = np.float32(2.)*rng.random(dtype=np.float32) - np.float32(1.)
+                y = np.float32(2.)*rng.random(dtype=np.float32) - np.float32(1.)
+                if store_samples:
+                    coords[i, 0] = x
+                    coords[i, 1] = y
+                s = x*x + y*y
+            else:
+                s = np.float32(0.)
+                for j in range(n_dim):
+                    x = np.float32(2.)*rng.random(dtype=np.float32) - np.float32(1.)
+                    if store_samples:
+                        coords[i, j] = x
+                    s += x*x
+            is_inside = s <= 1.
+            if store_samples:
+                inside[i] = is_inside
+            running += is_inside
+            count[i] = running
+        block_count[c] = running
+
+    # shift the running count of each block by the points found in the previous ones
+    offset = np.cumsum(block_count) - block_count
+    for c in prange(n_blocks):
+        for i in range(c*block_size, min((c + 1)*block_size, n_samples)):
+            count[i] += offset[c]
+
+    return coords, inside, count
+
+
+def _count_inside(n_samples, n_dim, seed, full_history):
+    """
+    Draws pseudo-random points in [-1, 1]^n_dim and counts those inside the unit n-sphere.
+
+    This is the worker function of `PiEstimator.estimate_fast`. The points are drawn in 
+    tiles of about `_TILE_SIZE` coordinates, so that the memory needed is that of one 
+    tile, plus the labels if full_history is True.
+
+    Keyword arguments:
+        n_samples (int):
+            The number of samples to draw.
+
+        n_dim (int):
+            The number of dimensions of the space.
+
+        seed (np.random.SeedSequence):
+            The seed of the random number generator of the worker.
+
+        full_history (bool):
+            If True, the label of every point is returned instead of the count.
+
+    Returns:
+        inside (int or np.ndarray):
+            The number of points inside the n-sphere, or the bool array of shape 
+            (n_samples,) of the labels if full_history is True.
+    """
+
+    rng = np.random.default_rng(seed)
+    tile = max(_TILE_SIZE//n_dim, 1)
+    inside = np.empty(n_samples, dtype=bool) if full_history else None
+    n_inside = 0
+
+    for start in range(0, n_samples, tile):
+        stop = min(start + tile, n_samples)
+        v = rng.random((stop - start, n_dim), dtype=np.float32)
+        v *= 2.
+        v -= 1.
+        inside_tile = (v*v).sum(axis=1) <= 1.
+        if full_history:
+            inside[start:stop] = inside_tile
+        else:
+            n_inside += np.count_nonzero(inside_tile)
+
+    if full_history:
+        return inside
+
+    return int(n_inside)
+
+
 class PiEstimator(object):
     """
     Estimates the value of the number Pi using the Monte Carlo method.
@@ -33,15 +176,23 @@ class PiEstimator(object):
             The confidence interval @ 95% confidence level
             at each draw.
         
+        coords (np.ndarray): float32 array of shape (n_samples, n_dimensions).
+            The x_1, ..., x_n_dim coordinates of the sample points. None if the
+            samples are not stored.
+
+        inside_bits (np.ndarray): uint8 array of shape (ceil(n_samples/8),).
+            The bit-packed labels of the sample points, where 1 means the point
+            is inside the n-sphere.
+
         samples (np.ndarray): array of shape (n_samples, n_dimensions + 1).
-            It stores the x_1, ..., x_n_dim coordinates of the sample points in
-            the first n_dimensions columns. The last column is a bool leable 
-            where True means the point is inside the n-sphere.
+            Read-only copy combining `coords` in the first n_dimensions columns and 
+            the inside label in the last column. It is built on first access and kept 
+            alongside `coords` until the next estimation.
 
             
     Methods:
 
-        estimate(n_samples, n_dimensions):    
+        estimate(n_samples, n_dimensions, sampler, seed, rng, store_samples):    
             Estimate the value of Pi using Monte Carlo sampling in n-dimensional space.
 
         plot_estimation(save_as_animation):
@@ -55,6 +206,9 @@ class PiEstimator(object):
             the estimation and the evolution of the confidence interval. This method is only
             available when the estimation is done in 2 dimensions.
 
+        estimate_fast(n_samples, n_dimensions, workers, seed, full_history):
+            Estimate the value of Pi with the Monte Carlo draws split across processes.
+
         results():
             Generate a summary table of the final area estimation results.
 
@@ -69,7 +223,45 @@ class PiEstimator(object):
         self.n_samples = None
         self.pi = None
         self.error = None
-        self.samples = None
+        self.coords = None
+        self.inside_bits = None
+        self._n_inside = None
+        self._samples = None
+        self._xs = None
+        self._shade_verts = None
+
+
+    @property
+    def samples(self):
+        """
+        Combines the coordinates and the labels of the sample points in a single array.
+
+        Returns:
+            samples (np.ndarray): array of shape (n_samples, n_dimensions + 1)
+                Read-only array of the coordinates of the sample points and the inside label 
+                in the last column. None if the samples are not stored.
+        """
+
+        if self._samples is None and self.coords is not None:
+            self._samples = np.empty((self.n_samples, self.n_dimensions + 1), dtype=self.coords.dtype)
+            self._samples[:, :self.n_dimensions] = self.coords
+            self._samples[:, self.n_dimensions] = self._inside()
+            # a copy that could silently diverge from coords and inside_bits if written to
+            self._samples.setflags(write=False)
+
+        return self._samples
+
+
+    def _inside(self):
+        """
+        Unpacks the labels of the sample points.
+
+        Returns:
+            inside (np.ndarray): bool array of shape (n_samples,)
+                True where the point is inside the n-sphere.
+        """
+
+        return np.unpackbits(self.inside_bits, count=self.n_samples).astype(bool)
 
 
     def _1st2_sign_figs(self, number):
@@ -83,14 +275,13 @@ class PiEstimator(object):
 
         Returns: 
             i (int): 
-                The index of the second significant fgure in number.
+                The number of decimal places up to the second significant figure of number.
         """
 
-        for i, elem in enumerate(str(number)):
-            if elem not in ['0', '.']:
-                break
+        if number == 0:
+            return 0
 
-        return i
+        return max(0, -int(floor(log10(abs(number))))) + 1
     
 
     def _animate_estimate(
@@ -111,10 +302,10 @@ class PiEstimator(object):
 
         """
 
-        plot.set_data(np.linspace(1, frame, frame), self.pi[:frame])
+        plot.set_data(self._xs[:frame], self.pi[:frame])
 
     
-    def _animate_sampling(self, frame, suptitle, x, ax, data, dist_plot, scatter_plot, shade_plot):
+    def _animate_sampling(self, frame, suptitle, x, palette, labels, data, dist_plot, scatter_plot, shade_plot):
         """
         Animation update function for visualizing sampling and distribution estimation.
 
@@ -135,43 +326,41 @@ class PiEstimator(object):
             x (np.ndarray): array-like of shape (400,)
                 The x-axis values for plotting the estimated distribution.
 
-            ax (matplotlib.axes.Axes)
-                The axes object where the scatter plot is drawn.
+            palette (np.ndarray): array of shape (2, 4)
+                The RGBA colours of the points outside (red) and inside (green) the n-sphere.
+
+            labels (np.ndarray): uint8 array of shape (n_samples,)
+                The inside label of each sample point, indexing `palette`.
+
+            data (np.ndarray): array of shape (n_samples, 3)
+                The 2D coordinates of the sample points and their inside label.
 
             dist_plot (matplotlib.lines.Line2D):
                 Line2D object representing the estimated distribution curve to be updated.
             
-            scatter_plot (list of matplotlib.collections.PathCollection):
-                The current scatter plot artists to be updated with new sample points.
+            scatter_plot (matplotlib.collections.PathCollection):
+                The scatter plot artist whose offsets and face colours are updated with the sample points.
             
             shade_plot (matplotlib.patches.Polygon):
-                Polygon object representing the shaded area under the confidence interval.
+                Polygon object representing the shaded area under the confidence interval,
+                its vertices being the preallocated array `self._shade_verts`.
 
         """
 
         suptitle.set_text(f"{frame} throws")
-        scatter_plot = sns.scatterplot(x = data[:frame,0], y = data[:frame,1], 
-                        hue = data[:frame,2], style = data[:frame,2], 
-                        color = ['green', 'red'], legend = False, 
-                        palette = {True: 'green', False: 'red'}, 
-                        markers = {True: 'o', False: 'o'}, s = 8, 
-                        linewidth=0.1, ax = ax
-                    )
+        scatter_plot.set_offsets(data[:frame,:2])
+        scatter_plot.set_facecolors(palette[labels[:frame]])
         
-        y_new = norm.pdf(x, self.pi[frame], 1 / np.sqrt(4*frame)) / np.sqrt(4*frame)
-        dist_plot.set_ydata(y_new)
+        # normal pdf of width sigma rescaled by sigma, evaluated in NumPy
+        sigma = 1./np.sqrt(4.*frame)
+        dist_plot.set_ydata(np.exp(-0.5*((x - self.pi[frame])/sigma)**2)/np.sqrt(2.*np.pi))
 
         new_xmin = self.pi[frame] - self.error[frame]
         new_xmax = self.pi[frame] + self.error[frame]
 
-        new_vertices = [
-            [new_xmin, 0.],
-            [new_xmin, 1.],
-            [new_xmax, 1.],
-            [new_xmax, 0.],
-            [new_xmin, 0.]
-        ]
-        shade_plot.set_xy(new_vertices)
+        self._shade_verts[[0, 1, 4], 0] = new_xmin
+        self._shade_verts[[2, 3], 0] = new_xmax
+        shade_plot.set_xy(self._shade_verts)
 
 
     def _frames(self):
@@ -194,65 +383,102 @@ class PiEstimator(object):
 
         """
         
-        if self.n_samples <= 100:
-            frame_list = [i for i in range(2, self.n_samples)]
-            
-        elif (self.n_samples > 100)&(self.n_samples <= 1000):
-            frame_list = [i for i in range(2, 100)]
-            frame_list += [i for i in range(100, self.n_samples, 25)]
-
-        elif (self.n_samples > 1000)&(self.n_samples <= 10000):
-            frame_list = [i for i in range(2, 100)]
-            frame_list += [i for i in range(100, 1000, 25)]
-            frame_list += [i for i in range(1000, self.n_samples, 50)]
-
-        elif (self.n_samples > 10000):
-            frame_list = [i for i in range(2, 100)]
-            frame_list += [i for i in range(100, 1000, 25)]
-            frame_list += [i for i in range(1000, 10000, 50)]
-            frame_list += [i for i in range(10000, self.n_samples, 100)]
-
-        return frame_list
+        chunks = [np.arange(2, min(self.n_samples, 100))]
+
+        if self.n_samples > 100:
+            chunks.append(np.arange(100, min(self.n_samples, 1000), 25))
+
+        if self.n_samples > 1000:
+            chunks.append(np.arange(1000, min(self.n_samples, 10000), 50))
+
+        if self.n_samples > 10000:
+            chunks.append(np.arange(10000, self.n_samples, 100))
+
+        return np.concatenate(chunks).tolist()
     
 
     def _random_projection(self, seed=42):
         """
         Projects high-dimensional data with labels to 2D using a random linear projection.
 
+        The projection plane is spanned by the orthonormal columns of the QR 
+        decomposition of a random Gaussian matrix.
+
         Keyword arguments:
-            points_with_label: np.ndarray of shape (n_samples, n_dimensions + 1)
-                The last column is a boolean indicating whether the point is inside the n-sphere.
+            seed (int, default=42):
+                The seed of the random number generator drawing the projection plane.
 
         Returns:
             proj_points: np.ndarray of shape (n_samples, 3)
+                The projected coordinates, the last column is a boolean indicating 
+                whether the point is inside the n-sphere.
         """
-        np.random.seed(seed)
-        points = self.samples[:, :self.n_dimensions]
-        labels = self.samples[:, -1]
-
-        # Create a random projection matrix: shape (n_dims, 2)
-        random_matrix = np.random.randn(self.n_dimensions, 2)
-        random_matrix /= np.linalg.norm(random_matrix, axis=0)  # normalize columns
+        if self.coords is None:
+            raise ValueError("Samples have not been stored. Please call `estimate` with `store_samples=True`.")
 
-        v0, v1 = random_matrix[:,0].reshape(1, -1), random_matrix[:,1].reshape(1, -1)
-        cos_gamma = (v0*v1).sum()
-        v1 = (v1 - cos_gamma*v0)/np.sqrt(1 - cos_gamma**2)
-        random_matrix[:, 1] = v1        
+        rng = np.random.default_rng(seed)
+        points = self.coords
 
-        # Project to 2D
-        proj_points = points @ random_matrix
+        # Create a random orthonormal projection matrix: shape (n_dims, 2)
+        random_matrix, _ = np.linalg.qr(rng.standard_normal((self.n_dimensions, 2)))
 
-        proj_points = np.hstack((proj_points, labels.reshape(-1,1)))
+        # Project to 2D, the labels filling the last column
+        proj_points = np.empty((self.n_samples, 3), dtype=points.dtype)
+        np.matmul(points, random_matrix.astype(points.dtype), out=proj_points[:, :2])
+        proj_points[:, 2] = self._inside()
 
         return proj_points
 
 
-    def estimate(self, n_samples, n_dimensions = 2):
+    def _pi_from_count(self, count, counts):
+        """
+        Computes the estimate of Pi from the number of sample points inside the n-sphere.
+
+        Keyword arguments:
+            count (np.ndarray): int array of shape (m,)
+                The number of points inside the n-sphere.
+
+            counts (np.ndarray): float array of shape (m,)
+                The corresponding number of points drawn.
+
+        Returns:
+            pi (np.ndarray): array of shape (m,)
+                The estimate value of Pi.
+        """
+
+        # in 2 dimensions pi = 4*count/counts, no root is needed
+        if self.n_dimensions == 2:
+            buf = count.astype(np.float64)
+            buf *= 4.
+            buf /= counts
+            return buf
+
+        # f is computed in log space as the factorials overflow at large dimensions
+        if self.n_dimensions % 2:
+            k = int((self.n_dimensions - 1)/2)
+            # the extra 1/4 of the odd dimensions is absorbed in f before taking the root
+            log_f = self.n_dimensions*np.log(2.) + gammaln(2*k + 2) - np.log(2.) - gammaln(k + 1) - k*np.log(4.)
+
+        else:
+            k = int(self.n_dimensions/2)
+            log_f = self.n_dimensions*np.log(2.) + gammaln(k + 1)
+
+        # (f*count/counts)**(1/k) evaluated in place to avoid temporary arrays,
+        # with f**(1/k) applied after the root so that f itself never overflows
+        buf = count.astype(np.float64)
+        buf /= counts
+        np.power(buf, 1./k, out=buf)
+        buf *= np.exp(log_f/k)
+        return buf
+
+
+    def estimate(self, n_samples, n_dimensions = 2, sampler = 'sobol', seed = None, rng = None, store_samples = True):
         """
         Estimate the value of Pi using Monte Carlo sampling in n-dimensional space.
 
-        This method generates `n_samples` uniformly random points within the n-dimensional 
-        cube [-1, 1]^n and determines the fraction that fall inside the n-dimensional 
+        This method generates `n_samples` points within the n-dimensional cube [-1, 1]^n, 
+        either from a scrambled Sobol low-discrepancy sequence or uniformly at random, 
+        and determines the fraction that fall inside the n-dimensional 
         unit hypersphere. The method also computes an error estimate and prints a summary 
         table of the results.
 
@@ -262,30 +488,170 @@ class PiEstimator(object):
             The number of samples to draw.
         n_dimensions (int, default=2):
             The number of dimensions to perform the estimation in. Must be ≥ 1.
+        sampler (str, default='sobol'):
+            The sampling method: 'sobol' for a scrambled Sobol sequence or 'random' for 
+            pseudo-random points drawn by a parallel Numba kernel. The first 'random' 
+            estimation compiles the kernel, which takes about 20 s. The compiled kernel
+            is cached on disk when the module is imported from the `pi_estimator` package.
+        seed (int, default=None):
+            The seed of the random number generator used by the sampler.
+            If None, a random seed is drawn. Ignored if `rng` is given.
+        rng (np.random.Generator, default=None):
+            The random number generator used by the sampler. If None, 
+            np.random.default_rng(seed) is used.
+        store_samples (bool, default=True):
+            If False, the coordinates and labels of the sample points are not kept,
+            which saves memory but makes `animate_sampling` unavailable. Only the
+            O(n_samples) arrays of the running count, `pi` and `error` are then allocated.
 
 
         Notes:
 
         - The final Pi estimate is rounded to the first two significant figures of the error.
+        - The quasi-random Sobol sequence converges as O((log N)^d / N) instead of the
+        O(1/sqrt(N)) of pseudo-random sampling, so the 95% confidence interval 
+        erfinv(0.95)/sqrt(4N) is a conservative bound on the actual error.
         """
 
         self.n_dimensions = n_dimensions
         self.n_samples = n_samples
 
-        v = 2.*np.random.rand(self.n_samples, self.n_dimensions) - 1.
-        self.samples = np.hstack((v, ((v**2).sum(axis=1) <= 1.).reshape(-1,1)))
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
+        if sampler == 'sobol':
+            sobol = qmc.Sobol(d=self.n_dimensions, scramble=True, seed=rng)
+
+            # Tiles of about _TILE_SIZE coordinates are drawn, rescaled, labelled and 
+            # counted while they are still in cache, the running count linking the tiles.
+            # Scrambled Sobol points are only balanced for powers of two, so the tile
+            # size is a power of two, at most the one following n_samples, and the 
+            # last tile is truncated.
+            m = int(np.ceil(np.log2(max(self.n_samples, 1))))
+            tile = 2**min(int(np.log2(max(_TILE_SIZE//self.n_dimensions, 1))), m)
+
+            # without storage, a single tile buffer is reused for every tile
+            n_stored = self.n_samples if store_samples else tile
+            v = np.empty((n_stored, self.n_dimensions), dtype=np.float32)
+            inside = np.empty(n_stored, dtype=bool)
+            count = np.empty(self.n_samples, dtype=np.int64)
+
+            running = 0
+            for start in range(0, self.n_samples, tile):
+                stop = min(start + tile, self.n_samples)
+                offset = start if store_samples else 0
+                v_tile = v[offset:offset + stop - start]
+                inside_tile = inside[offset:offset + stop - start]
+                u = sobol.random(tile)[:stop - start]
+                np.multiply(u, 2., out=v_tile, casting='unsafe')
+                v_tile -= 1.
+                np.less_equal((v_tile*v_tile).sum(axis=1), 1., out=inside_tile)
+                np.cumsum(inside_tile, out=count[start:stop])
+                count[start:stop] += running
+                running = count[stop - 1]
+
+        elif sampler == 'random':
+            streams = tuple(rng.spawn(_N_STREAMS))
+            v, inside, count = _mc_kernel(self.n_samples, self.n_dimensions, streams, store_samples)
 
-        if self.n_dimensions % 2:
-            k = int((self.n_dimensions - 1)/2)
-            f = 2.**self.n_dimensions*factorial(2*k + 1)/(2.*factorial(k))
-            self.pi = 1/4.*(f*self.samples[:,self.n_dimensions].cumsum()/np.ones(self.n_samples).cumsum())**(1/k)
+        else:
+            raise ValueError(f"Unknown sampler '{sampler}'. Please choose 'sobol' or 'random'.")
 
+        if store_samples:
+            self.coords, self.inside_bits = v, np.packbits(inside)
         else:
-            k = int(self.n_dimensions/2)
-            f = 2.**self.n_dimensions*factorial(k)
-            self.pi = (f*self.samples[:,self.n_dimensions].cumsum()/np.ones(self.n_samples).cumsum())**(1/k)    
+            self.coords, self.inside_bits = None, None
+
+        self._n_inside = int(count[-1])
+        self._samples = None
+
+        counts = np.arange(1, self.n_samples + 1, dtype=np.float64)
+
+        self.pi = self._pi_from_count(count, counts)
+        del count
+
+        # erfinv(0.95)/sqrt(4*counts) evaluated in place, counts being no longer needed
+        counts *= 4.
+        np.sqrt(counts, out=counts)
+        self.error = np.divide(_ERFINV_095, counts, out=counts)
+
+
+    def estimate_fast(self, n_samples, n_dimensions = 2, workers = None, seed = None, full_history = False):
+        """
+        Estimate the value of Pi using Monte Carlo sampling split across processes.
+
+        This method splits the `n_samples` pseudo-random draws in [-1, 1]^n into one chunk 
+        per worker and counts the points inside the n-dimensional unit hypersphere in 
+        parallel processes, each with an independent random stream. Only the final 
+        estimate is computed, unless `full_history` is True.
+
+        Keyword arguments:
+        
+        n_samples (int):
+            The number of samples to draw.
+        n_dimensions (int, default=2):
+            The number of dimensions to perform the estimation in. Must be ≥ 1.
+        workers (int, default=None):
+            The number of worker processes, at least 1. If None, the number of CPUs is used.
+        seed (int, default=None):
+            The seed of the random number generator. If None, a random seed is drawn.
+        full_history (bool, default=False):
+            If True, `pi` and `error` hold the estimation at each draw as in `estimate`.
+            Otherwise, they only hold the final value.
+
+
+        Notes:
+
+        - The coordinates of the sample points are not kept, so `animate_sampling` is not
+        available after this method, and `plot_estimation` requires `full_history=True`.
+        - The workers are started with the 'spawn' method, as forking a process that 
+        already runs the Numba threads of the 'random' sampler is not safe. The calling 
+        script must therefore be guarded by `if __name__ == '__main__':`.
+        - Each spawned worker re-imports the module and its dependencies, a fixed start-up
+        cost of one to several seconds. Below `_PARALLEL_MIN_SAMPLES` samples, or with a 
+        single worker, the chunks are therefore counted serially in the calling process, 
+        with the same random streams and thus the same result.
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, got {workers}.")
+
+        self.n_dimensions = n_dimensions
+        self.n_samples = n_samples
+
+        chunk, extra = divmod(n_samples, workers)
+        chunks = [chunk + 1]*extra + [chunk]*(workers - extra)
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+
+        args = (chunks, [n_dimensions]*workers, seeds, [full_history]*workers)
+
+        if workers == 1 or n_samples < _PARALLEL_MIN_SAMPLES:
+            inside = list(map(_count_inside, *args))
 
-        self.error = erfinv(0.95)/np.sqrt(4.*np.ones(n_samples).cumsum())
+        else:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+                inside = list(executor.map(_count_inside, *args))
+
+        if full_history:
+            inside = np.concatenate(inside)
+            count = np.cumsum(inside, dtype=np.int64)
+            counts = np.arange(1, self.n_samples + 1, dtype=np.float64)
+            self.inside_bits = np.packbits(inside)
+
+        else:
+            count = np.array([sum(inside)], dtype=np.int64)
+            counts = np.array([self.n_samples], dtype=np.float64)
+            self.inside_bits = None
+
+        self.coords = None
+        self._n_inside = int(count[-1])
+        self._samples = None
+
+        self.pi = self._pi_from_count(count, counts)
+        self.error = _ERFINV_095/np.sqrt(4.*counts)
 
 
     def results(self):
@@ -319,7 +685,7 @@ class PiEstimator(object):
         estimation_table = PrettyTable(["quantity", "value"])
         estimation_table.add_row(["dimension", self.n_dimensions])
         estimation_table.add_row(["samples", self.n_samples])
-        estimation_table.add_row([f"samples in {self.n_dimensions}-sphere", int(self.samples[:,self.n_dimensions].sum())])
+        estimation_table.add_row([f"samples in {self.n_dimensions}-sphere", self._n_inside])
         estimation_table.add_row(["π", np.round(self.pi[-1], sig_figs)])
         estimation_table.add_row(["conf. interval @95%", f'[{np.round(self.pi[-1] - self.error[-1], sig_figs)}, {np.round(self.pi[-1] + self.error[-1], sig_figs)}]'])
 
@@ -357,8 +723,14 @@ class PiEstimator(object):
         if self.pi is None or self.error is None:
             raise ValueError(error_message)
 
+        error_message = "Only the final estimate has been stored. Please call `estimate`, or `estimate_fast` with `full_history=True`, before `plot_estimation`."
+        if len(self.pi) != self.n_samples:
+            raise ValueError(error_message)
+
+        self._xs = np.arange(1, self.n_samples + 1, dtype=np.float64)
+
         plt.figure(figsize=(8,5))
-        plt.plot(np.linspace(1,self.n_samples,self.n_samples),self.pi)
+        plt.plot(self._xs,self.pi)
         plt.title(f'Estimated $\\pi$ vs. number of samples in {self.n_dimensions}-d')
         plt.hlines(y=np.pi, xmin=1, xmax=self.n_samples, linestyles= '--', colors = 'black', label = r'Real $\pi$')
         plt.xlabel('Number of samples')
@@ -418,6 +790,10 @@ class PiEstimator(object):
         error_message = "Estimation has not been performed. Please call `estimate` before `animate_sampling`."
         if self.pi is None or self.error is None:
             raise ValueError(error_message)
+
+        error_message = "Samples have not been stored. Please call `estimate` with `store_samples=True` before `animate_sampling`, as `estimate_fast` does not keep them."
+        if self.coords is None:
+            raise ValueError(error_message)
         
 
         if self.n_dimensions == 2:
@@ -441,13 +817,9 @@ class PiEstimator(object):
         ax1.set_aspect('equal')  # force square
                 
         # 1st frame
-        scatter = sns.scatterplot(x = sample_points[:1,0], y = sample_points[:1,1], 
-                        hue = sample_points[:1,2], style = sample_points[:1,2], 
-                        color = ['green', 'red'], legend = False, 
-                        palette = {True: 'green', False: 'red'}, 
-                        markers = {True: 'o', False: 'o'}, s = 8, 
-                        linewidth=0.1, ax = ax1
-                    )
+        palette = to_rgba_array(['red', 'green'])
+        labels = sample_points[:,2].astype(np.uint8)
+        scatter = ax1.scatter(sample_points[:1,0], sample_points[:1,1], c = palette[labels[:1]], s = 8, linewidths = 0.1)
         ax1.set_xlim((-1.,1))
         ax1.set_ylim((-1.,1))
         ax1.set_xticks([-1., 0., 1.])
@@ -458,9 +830,14 @@ class PiEstimator(object):
         # Make a rectangular plot (2x1 block)
         ax2 = fig.add_subplot(gs[:, 1])  # right column (span rows)
                 
-        dist_plot, = ax2.plot(x, norm.pdf(x,self.pi[1],1/np.sqrt(4))/np.sqrt(4))
+        dist_plot, = ax2.plot(x, np.exp(-0.5*((x - self.pi[1])/0.5)**2)/np.sqrt(2.*np.pi))
         ax2.vlines(x=np.pi, ymin=0., ymax=.5,linestyles='--', colors = 'black', label = r'Real $\pi$')
-        shade_plot = ax2.axvspan(self.pi[1] - self.error[1], self.pi[1] + self.error[1], alpha=0.2, facecolor='red', label = '95% Confidence Level')
+        # vertical span drawn as a polygon whose vertices are updated in place,
+        # x in data coordinates and y in axes coordinates as for axvspan
+        self._shade_verts = np.array([[0., 0.], [0., 1.], [0., 1.], [0., 0.], [0., 0.]])
+        self._shade_verts[[0, 1, 4], 0] = self.pi[1] - self.error[1]
+        self._shade_verts[[2, 3], 0] = self.pi[1] + self.error[1]
+        shade_plot = ax2.add_patch(Polygon(self._shade_verts, transform=ax2.get_xaxis_transform(), alpha=0.2, facecolor='red', label = '95% Confidence Level'))
         ax2.set_xlim((0.,4.))
         ax2.set_ylim(0.,0.5)
         ax2.set_xticks([0., 1., 2., 3., 4.])
@@ -470,13 +847,14 @@ class PiEstimator(object):
                 
         plt.tight_layout()
 
-        frm = self._frames()
+        # with 2 samples or fewer, the animation is only the last frame
+        frm = self._frames() or [self.n_samples - 1]
 
         ani = animation.FuncAnimation(
             fig, 
             self._animate_sampling, 
             frames=frm, 
-            fargs=(suptitle, x, ax1, sample_points, dist_plot, scatter, shade_plot), 
+            fargs=(suptitle, x, palette, labels, sample_points, dist_plot, scatter, shade_plot), 
             repeat=False
             )
 